@@ -17,7 +17,7 @@ from torch_sim.units import MetalUnits as Units
 
 device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 dtype = torch.float32
-kT = 1000 * Units.temperature
+kT = torch.tensor(1000 * Units.temperature, device=device, dtype=dtype)
 
 # Option 1: Load the raw model from the downloaded model
 loaded_model = mace_mp(
@@ -54,7 +54,9 @@ coords = [
 ]
 structure = Structure(lattice, species, coords)
 
-state = ts.io.structures_to_state([structure], device=device, dtype=dtype)
+# Run independent replicas as one batch so each model call covers all of them
+n_replicas = 8
+state = ts.io.structures_to_state([structure] * n_replicas, device=device, dtype=dtype)
 
 
 # %%
@@ -76,7 +78,7 @@ class HybridSwapMCState(ts.SwapMCState, MDState):
     )
 
 
-md_state = ts.nvt_langevin_init(state=state, model=model, kT=torch.tensor(kT), seed=42)
+md_state = ts.nvt_langevin_init(state=state, model=model, kT=kT, seed=42)
 
 swap_state = ts.swap_mc_init(state=md_state, model=model)
 hybrid_state = HybridSwapMCState(
@@ -90,11 +92,10 @@ rng = torch.Generator(device=device)
 rng.manual_seed(42)
 
 n_steps = 100
-dt = torch.tensor(0.002)
-for step in range(n_steps):
-    if step % 10 == 0:
-        hybrid_state = ts.swap_mc_step(state=hybrid_state, model=model, kT=kT, rng=rng)
-    else:
-        hybrid_state = ts.nvt_langevin_step(
-            model=model, state=hybrid_state, dt=dt, kT=torch.tensor(kT)
-        )
+swap_interval = 10
+dt = torch.tensor(0.002, device=device, dtype=dtype)
+# Each cycle attempts one swap move followed by a fixed block of MD steps
+for _cycle in range(n_steps // swap_interval):
+    hybrid_state = ts.swap_mc_step(state=hybrid_state, model=model, kT=kT, rng=rng)
+    for _ in range(swap_interval - 1):
+        hybrid_state = ts.nvt_langevin_step(model=model, state=hybrid_state, dt=dt, kT=kT)
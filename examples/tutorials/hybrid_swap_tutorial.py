@@ -156,16 +156,17 @@ rng.manual_seed(42)
 
 # Run the hybrid simulation
 n_steps = 100
-for step in range(n_steps):
-    if step % 10 == 0:  # Attempt swap Monte Carlo move
-        hybrid_state = ts.swap_mc_step(
-            state=hybrid_state, model=mace_model, kT=kT, rng=rng
-        )
-    else:  # Perform MD step
+swap_interval = 10
+for cycle in range(n_steps // swap_interval):
+    # Attempt swap Monte Carlo move
+    hybrid_state = ts.swap_mc_step(state=hybrid_state, model=mace_model, kT=kT, rng=rng)
+    # Perform MD steps until the next swap attempt
+    for _ in range(swap_interval - 1):
         hybrid_state = ts.nvt_langevin_step(
             model=mace_model, state=hybrid_state, dt=0.002, kT=kT
         )
 
+    step = (cycle + 1) * swap_interval
     if step % 20 == 0:
         print(f"Step {step}: Energy = {hybrid_state.energy.item():.3f} eV")
 
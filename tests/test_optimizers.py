@@ -1,4 +1,3 @@
-import copy
 from collections.abc import Callable
 from dataclasses import fields
 from functools import partial
@@ -46,7 +45,7 @@ def test_gradient_descent_optimization(
     )
 
     # Check force convergence
-    max_force = torch.max(torch.norm(state.forces, dim=1))
+    max_force = state.forces.square().sum(dim=1).amax().sqrt()
     assert max_force < 0.2, f"Forces should be small after optimization, got {max_force=}"
 
     assert not torch.allclose(state.positions, initial_state.positions)
@@ -87,7 +86,7 @@ def test_unit_cell_gradient_descent_optimization(
     )
 
     # Check force convergence
-    max_force = torch.max(torch.norm(state.forces, dim=1))
+    max_force = state.forces.square().sum(dim=1).amax().sqrt()
     pressure = torch.trace(state.stress.squeeze(0)) / 3.0
     assert pressure < 0.01, (
         f"Pressure should be small after optimization, got {pressure=}"
@@ -127,14 +126,16 @@ def test_fire_optimization(
         current_sim_state, lj_model, fire_flavor=fire_flavor, dt_start=0.1
     )
 
-    # Run optimization for a few steps
+    # Run optimization in fixed blocks of steps, syncing the energy once per block
     energies = [1000, state.energy.item()]
     max_steps = 1000  # Add max step to prevent infinite loop
+    steps_per_check = 16
     steps_taken = 0
     while abs(energies[-2] - energies[-1]) > 1e-6 and steps_taken < max_steps:
-        state = ts.fire_step(state=state, model=lj_model, dt_max=0.3)
+        for _ in range(steps_per_check):
+            state = ts.fire_step(state=state, model=lj_model, dt_max=0.3)
         energies.append(state.energy.item())
-        steps_taken += 1
+        steps_taken += steps_per_check
 
     assert steps_taken < max_steps, (
         f"FIRE optimization for {fire_flavor=} did not converge in {max_steps=}"
@@ -149,7 +150,7 @@ def test_fire_optimization(
     )
 
     # Check force convergence
-    max_force = torch.max(torch.norm(state.forces, dim=1))
+    max_force = state.forces.square().sum(dim=1).amax().sqrt()
     # bumped up the tolerance to 0.3 to account for the fact that ase_fire is more lenient
     # in beginning steps
     assert max_force < 0.3, (
@@ -231,8 +232,8 @@ def test_fire_ase_negative_power_branch(
     # Store forces that will be used in the power calculation and v += dt*F step
     forces_at_power_calc = state.forces.clone()
 
-    # Deepcopy state as step_fn modifies it in-place
-    state_to_update = copy.deepcopy(state)
+    # Clone state as step_fn modifies it in-place
+    state_to_update = state.clone()
     updated_state = ts.fire_step(
         state=state_to_update,
         model=lj_model,
@@ -288,7 +289,7 @@ def test_fire_vv_negative_power_branch(
     initial_dt_batch = state.dt.clone()
     initial_alpha_batch = state.alpha.clone()  # Already alpha_start
 
-    state_to_update = copy.deepcopy(state)
+    state_to_update = state.clone()
     updated_state = ts.fire_step(
         state=state_to_update,
         model=lj_model,
@@ -382,7 +383,7 @@ def test_unit_cell_fire_optimization(
     )
 
     # Check force convergence
-    max_force = torch.max(torch.norm(state.forces, dim=1))
+    max_force = state.forces.square().sum(dim=1).amax().sqrt()
     pressure = torch.trace(state.stress.squeeze(0)) / 3.0
     assert pressure < 0.01, (
         f"Pressure should be small after optimization, got {pressure=}"
@@ -595,7 +596,7 @@ def test_frechet_cell_fire_optimization(
     )
 
     # Check force convergence
-    max_force = torch.max(torch.norm(state.forces, dim=1))
+    max_force = state.forces.square().sum(dim=1).amax().sqrt()
     # Assumes single batch for this state stress access
     pressure = torch.trace(state.stress.squeeze(0)) / 3.0
 
@@ -619,6 +620,35 @@ def test_frechet_cell_fire_optimization(
     )
 
 
+def _fire_until_converged[T: FireState](
+    state: T,
+    model: ModelInterface,
+    *,
+    steps_per_check: int = 8,
+    max_steps: int = 1000,
+    **step_kwargs: Any,
+) -> T:
+    """Run FIRE until all system energies change by less than 1e-6 between checks.
+
+    Energies are only compared (a host sync) once every ``steps_per_check`` steps.
+    """
+    current_energy = state.energy.clone()
+    prev_energy = current_energy + 1
+
+    step = 0
+    with torch.inference_mode():
+        while not torch.allclose(current_energy, prev_energy, atol=1e-6):
+            prev_energy = current_energy
+            for _ in range(steps_per_check):
+                state = ts.fire_step(state=state, model=model, **step_kwargs)
+            current_energy = state.energy.clone()
+            step += steps_per_check
+            if step > max_steps:
+                raise ValueError(f"Optimization did not converge in {step=}")
+
+    return state
+
+
 @pytest.mark.parametrize(
     "filter_func",
     [None, ts.CellFilter.unit, ts.CellFilter.frechet],
@@ -655,75 +685,41 @@ def test_optimizer_batch_consistency(
     # Ensure state2_orig is identical to perturbed state1_orig
     state2_orig = state1_orig.clone()
 
-    final_individual_states = []
-
-    def energy_converged(e_current: torch.Tensor, e_prev: torch.Tensor) -> bool:
-        """Check for energy convergence (scalar energies)."""
-        return not torch.allclose(e_current, e_prev, atol=1e-6)
+    init_fn, _ = ts.OPTIM_REGISTRY[ts.Optimizer.fire]
 
-    for state_for_indiv_opt in [state1_orig.clone(), state2_orig.clone()]:
-        init_fn_indiv, step_fn_indiv = ts.OPTIM_REGISTRY[ts.Optimizer.fire]
-        opt_state_indiv = init_fn_indiv(
+    # Both systems start identical, so a single individual run is the reference
+    opt_state_indiv = _fire_until_converged(
+        init_fn(
             model=lj_model,
-            state=state_for_indiv_opt,
+            state=state1_orig.clone(),
             dt_start=0.1,
             cell_filter=filter_func,
-        )
-
-        current_e_indiv = opt_state_indiv.energy
-        # Ensure prev_e_indiv is different to start the loop
-        e_prev_indiv = current_e_indiv + torch.tensor(
-            1.0, device=current_e_indiv.device, dtype=current_e_indiv.dtype
-        )
-
-        steps_indiv = 0
-        while energy_converged(current_e_indiv, e_prev_indiv):
-            e_prev_indiv = current_e_indiv
-            opt_state_indiv = step_fn_indiv(
-                model=lj_model, state=opt_state_indiv, dt_max=0.3
-            )
-            current_e_indiv = opt_state_indiv.energy
-            steps_indiv += 1
-            if steps_indiv > 1000:
-                raise ValueError(
-                    f"Individual opt for {filter_func.name} did not converge"
-                )
-        final_individual_states.append(opt_state_indiv)
+        ),
+        lj_model,
+        dt_max=0.3,
+    )
 
     # Batched optimization
     multi_state_initial = ts.concatenate_states(
         [state1_orig.clone(), state2_orig.clone()],
         device=ar_supercell_sim_state.device,
     )
-
-    init_fn_batch, step_fn_batch = ts.OPTIM_REGISTRY[ts.Optimizer.fire]
-    batch_opt_state = init_fn_batch(
-        model=lj_model, state=multi_state_initial, cell_filter=filter_func
-    )
-
-    e_current_batch = batch_opt_state.energy.clone()
-    # Ensure e_prev_batch requires update and has same shape
-    e_prev_batch = e_current_batch + torch.tensor(
-        1.0, device=e_current_batch.device, dtype=e_current_batch.dtype
+    batch_opt_state = _fire_until_converged(
+        init_fn(model=lj_model, state=multi_state_initial, cell_filter=filter_func),
+        lj_model,
     )
+    e_current_batch = batch_opt_state.energy
 
-    steps_batch = 0
-    # Converge when all batch energies have converged
-    while not torch.allclose(e_current_batch, e_prev_batch, atol=1e-6):
-        e_prev_batch = e_current_batch.clone()
-        batch_opt_state = step_fn_batch(model=lj_model, state=batch_opt_state)
-        e_current_batch = batch_opt_state.energy.clone()
-        steps_batch += 1
-        if steps_batch > 1000:
-            raise ValueError(f"Batched opt for {filter_func.name} did not converge")
-
-    individual_final_energies = [s.energy.item() for s in final_individual_states]
-    for idx, indiv_energy in enumerate(individual_final_energies):
+    indiv_energy = opt_state_indiv.energy.item()
+    for idx in range(multi_state_initial.n_systems):
         assert abs(e_current_batch[idx].item() - indiv_energy) < 1e-4, (
             f"Energy batch {idx} ({filter_func=}): "
             f"{e_current_batch[idx].item()} vs indiv {indiv_energy}"
         )
 
+    # we are evolving identical systems
+    assert e_current_batch[0] == e_current_batch[1]
+
     # Check positions changed for both parts of the batch
     n_atoms_first_state = state1_orig.positions.shape[0]
     assert not torch.allclose(
@@ -744,37 +740,33 @@ def test_optimizer_batch_consistency(
 
 
 def test_unit_cell_fire_multi_batch(
-    ar_supercell_sim_state: SimState, lj_model: ModelInterface
+    ar_supercell_sim_state: SimState,
+    ar_double_sim_state: SimState,
+    lj_model: ModelInterface,
 ) -> None:
     """Test FIRE optimization with multiple batches."""
-    # Create a multi-batch system by duplicating ar_fcc_state
+    # Multi-batch system made of two copies of ar_supercell_sim_state
+    multi_state = ar_double_sim_state
 
-    generator = torch.Generator(device=ar_supercell_sim_state.device)
-
-    ar_supercell_sim_state_1 = copy.deepcopy(ar_supercell_sim_state)
-    ar_supercell_sim_state_2 = copy.deepcopy(ar_supercell_sim_state)
+    generator = torch.Generator(device=multi_state.device)
 
-    for state in (ar_supercell_sim_state_1, ar_supercell_sim_state_2):
-        generator.manual_seed(43)
-        state.positions += (
-            torch.randn(
-                state.positions.shape,
-                device=state.device,
-                generator=generator,
-            )
-            * 0.1
+    # Apply the same perturbation to both systems with a single draw
+    generator.manual_seed(43)
+    noise = (
+        torch.randn(
+            ar_supercell_sim_state.positions.shape,
+            device=multi_state.device,
+            generator=generator,
         )
-
-    multi_state = ts.concatenate_states(
-        [ar_supercell_sim_state_1, ar_supercell_sim_state_2],
-        device=ar_supercell_sim_state.device,
+        * 0.1
     )
+    multi_state.positions += noise.repeat(multi_state.n_systems, 1)
 
     # Initialize FIRE optimizer with unit cell filter
     state = ts.fire_init(
         state=multi_state, model=lj_model, dt_start=0.1, cell_filter=ts.CellFilter.unit
     )
-    initial_state = copy.deepcopy(state)
+    initial_state = state.clone()
 
     # Run optimization for a few steps
     prev_energy = torch.ones(2, device=state.device, dtype=state.energy.dtype) * 1000
@@ -798,7 +790,7 @@ def test_unit_cell_fire_multi_batch(
     )
 
     # transfer the energy and force checks to the batched optimizer
-    max_force = torch.max(torch.norm(state.forces, dim=1))
+    max_force = state.forces.square().sum(dim=1).amax().sqrt()
     assert torch.all(max_force < 0.1), (
         f"Forces should be small after optimization, got {max_force=}"
     )
@@ -815,95 +807,53 @@ def test_unit_cell_fire_multi_batch(
     assert current_energy[0] == current_energy[1]
 
 
-def test_fire_fixed_cell_unit_cell_consistency(  # noqa: C901
-    ar_supercell_sim_state: SimState, lj_model: ModelInterface
+def test_fire_fixed_cell_unit_cell_consistency(
+    ar_supercell_sim_state: SimState,
+    ar_double_sim_state: SimState,
+    lj_model: ModelInterface,
 ) -> None:
     """Test batched Frechet Fixed cell FIRE optimization is
     consistent with FIRE (position only) optimizations."""
-    generator = torch.Generator(device=ar_supercell_sim_state.device)
+    multi_state = ar_double_sim_state
 
-    ar_supercell_sim_state_1 = copy.deepcopy(ar_supercell_sim_state)
-    ar_supercell_sim_state_2 = copy.deepcopy(ar_supercell_sim_state)
+    generator = torch.Generator(device=multi_state.device)
 
-    # Add same random perturbation to both states
-    for state in (ar_supercell_sim_state_1, ar_supercell_sim_state_2):
-        generator.manual_seed(43)
-        state.positions += (
-            torch.randn(state.positions.shape, device=state.device, generator=generator)
-            * 0.1
+    # Apply the same perturbation to both systems with a single draw
+    generator.manual_seed(43)
+    noise = (
+        torch.randn(
+            ar_supercell_sim_state.positions.shape,
+            device=multi_state.device,
+            generator=generator,
         )
+        * 0.1
+    )
+    multi_state.positions += noise.repeat(multi_state.n_systems, 1)
 
-    # Optimize each state individually
-    final_individual_states_unit_cell = []
-    total_steps_unit_cell = []
-
-    def energy_converged(current_energy: torch.Tensor, prev_energy: torch.Tensor) -> bool:
-        """Check if optimization should continue based on energy convergence."""
-        return not torch.allclose(current_energy, prev_energy, atol=1e-6)
-
-    for state in (ar_supercell_sim_state_1, ar_supercell_sim_state_2):
-        state_opt = ts.fire_init(
-            state,
+    final_state_unit_cell = _fire_until_converged(
+        ts.fire_init(
+            multi_state.clone(),
             lj_model,
             dt_start=0.1,
             cell_filter=ts.CellFilter.unit,
             hydrostatic_strain=True,
             constant_volume=True,
-        )
-
-        # Run optimization until convergence
-        current_energy = state_opt.energy
-        prev_energy = current_energy + 1
-
-        step = 0
-        while energy_converged(current_energy, prev_energy):
-            prev_energy = current_energy
-            state_opt = ts.fire_step(state=state_opt, model=lj_model, dt_max=0.3)
-            current_energy = state_opt.energy
-            step += 1
-            if step > 1000:
-                raise ValueError("Optimization did not converge")
-
-        final_individual_states_unit_cell.append(state_opt)
-        total_steps_unit_cell.append(step)
-
-    # Optimize each state individually
-    final_individual_states_fire = []
-    total_steps_fire = []
-
-    def energy_converged(current_energy: torch.Tensor, prev_energy: torch.Tensor) -> bool:
-        """Check if optimization should continue based on energy convergence."""
-        return not torch.allclose(current_energy, prev_energy, atol=1e-6)
-
-    for state in (ar_supercell_sim_state_1, ar_supercell_sim_state_2):
-        state_opt = ts.fire_init(state=state, model=lj_model, dt_start=0.1)
-
-        # Run optimization until convergence
-        current_energy = state_opt.energy
-        prev_energy = current_energy + 1
-
-        step = 0
-        while energy_converged(current_energy, prev_energy):
-            prev_energy = current_energy
-            state_opt = ts.fire_step(state=state_opt, model=lj_model, dt_max=0.3)
-            current_energy = state_opt.energy
-            step += 1
-            if step > 1000:
-                raise ValueError(f"Optimization did not converge in {step=}")
-
-        final_individual_states_fire.append(state_opt)
-        total_steps_fire.append(step)
+        ),
+        lj_model,
+        dt_max=0.3,
+    )
+    final_state_fire = _fire_until_converged(
+        ts.fire_init(state=multi_state.clone(), model=lj_model, dt_start=0.1),
+        lj_model,
+        dt_max=0.3,
+    )
 
-    individual_energies_unit_cell = [
-        state.energy.item() for state in final_individual_states_unit_cell
-    ]
-    individual_energies_fire = [
-        state.energy.item() for state in final_individual_states_fire
-    ]
     # Check that final energies from fixed cell optimization match
     # position only optimizations
-    for step, energy_unit_cell in enumerate(individual_energies_unit_cell):
-        assert abs(energy_unit_cell - individual_energies_fire[step]) < 1e-4, (
-            f"Energy for system {step} doesn't match position only optimization: "
-            f"system={energy_unit_cell}, individual={individual_energies_fire[step]}"
+    for sys_idx in range(multi_state.n_systems):
+        energy_unit_cell = final_state_unit_cell.energy[sys_idx].item()
+        energy_fire = final_state_fire.energy[sys_idx].item()
+        assert abs(energy_unit_cell - energy_fire) < 1e-4, (
+            f"Energy for system {sys_idx} doesn't match position only optimization: "
+            f"unit_cell={energy_unit_cell}, position_only={energy_fire}"
         )
@@ -66,13 +66,11 @@ def _ou_step(
 
     c2 = torch.sqrt(kT * (1 - torch.square(c1))).unsqueeze(-1)
 
-    # Generate random noise from normal distribution
+    # Generate random noise from normal distribution, then scale and accumulate
+    # in place so the noise tensor becomes the new momenta without temporaries
     noise = torch.randn_like(state.momenta, device=state.device, dtype=state.dtype)
-    new_momenta = (
-        c1.unsqueeze(-1) * state.momenta
-        + c2 * torch.sqrt(state.masses).unsqueeze(-1) * noise
-    )
-    state.momenta = new_momenta
+    noise *= c2 * torch.sqrt(state.masses).unsqueeze(-1)
+    state.momenta = noise.addcmul_(c1.unsqueeze(-1), state.momenta)
     return state
 
 
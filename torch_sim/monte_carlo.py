@@ -262,7 +262,7 @@ def swap_mc_step(
         raise ValueError("Swaps must be between atoms in the same system")
 
     energies_old = state.energy.clone()
-    state.positions = state.positions[permutation].clone()
+    state.positions = state.positions[permutation]
 
     model_output = model(state)
     energies_new = model_output["energy"]
@@ -273,6 +273,6 @@ def swap_mc_step(
     state.positions = state.positions[reverse_rejected_swaps]
 
     state.energy = torch.where(accepted, energies_new, energies_old)
-    state.last_permutation = permutation[reverse_rejected_swaps].clone()
+    state.last_permutation = permutation[reverse_rejected_swaps]
 
     return state